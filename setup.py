@@ -0,0 +1,39 @@
+"""
+Build script for freelancer-mcp-server.
+
+When Cython is available, src/freelancer_mcp/models.py is compiled to a C
+extension so the hot request-model instantiation path runs compiled code.
+The .py source is kept in the wheel for debugging and as a fallback, and
+the build degrades gracefully to a pure-Python install when Cython is not
+installed. server.py is intentionally left uncompiled: FastMCP's tool
+decorator inspects Pydantic-typed signatures in ways a compiled module
+does not support.
+"""
+
+import os
+
+from setuptools import setup
+
+try:
+    from Cython.Build import cythonize
+
+    ext_modules = cythonize(
+        ["src/freelancer_mcp/models.py"],
+        compiler_directives={
+            "language_level": 3,
+            "boundscheck": False,
+            "wraparound": False,
+        },
+    )
+
+    # On GCC/Clang toolchains, build the extension with full optimization
+    # and link-time optimization; MSVC uses different flags and keeps the
+    # compiler defaults
+    if os.name == "posix":
+        for ext in ext_modules:
+            ext.extra_compile_args = ["-O3", "-flto"]
+            ext.extra_link_args = ["-flto"]
+except ImportError:
+    ext_modules = []
+
+setup(ext_modules=ext_modules)
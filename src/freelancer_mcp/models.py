@@ -3,7 +3,9 @@ Pydantic models for request/response validation
 """
 
 from typing import Dict, List, Optional, Any
-from pydantic import BaseModel, Field
+import requests
+from requests.adapters import HTTPAdapter, Retry
+from pydantic import BaseModel, ConfigDict, Field
 from freelancersdk.session import Session
 from .config import settings
 from .exceptions import AuthenticationError
@@ -19,6 +21,8 @@ class ProjectSearchRequest(BaseModel):
 
 class ProjectDetailsRequest(BaseModel):
     """Request model for project details"""
+    model_config = ConfigDict(strict=False, validate_assignment=False)
+
     project_ids: List[int] = Field(description="List of project IDs to fetch")
     full_description: bool = Field(default=True, description="Include full project description")
     include_jobs: bool = Field(default=True, description="Include job/skill information")
@@ -27,6 +31,8 @@ class ProjectDetailsRequest(BaseModel):
 
 class UserSearchRequest(BaseModel):
     """Request model for freelancer search"""
+    model_config = ConfigDict(strict=False, validate_assignment=False)
+
     query: str = Field(description="Search query for freelancers")
     job_ids: Optional[List[int]] = Field(default=None, description="Filter by specific job/skill IDs")
     location_ids: Optional[List[int]] = Field(default=None, description="Filter by location IDs")
@@ -35,7 +41,9 @@ class UserSearchRequest(BaseModel):
 
 class FreelancerSession:
     """Manages Freelancer API session"""
-    
+
+    __slots__ = ('session',)
+
     def __init__(self):
         self.session = None
         self._initialize_session()
@@ -50,9 +58,34 @@ class FreelancerSession:
                 oauth_token=settings.oauth_token,
                 url=settings.api_url
             )
+            self._configure_http_pooling()
+        except AuthenticationError:
+            raise
         except Exception as e:
             raise AuthenticationError(f"Failed to create session: {e}")
-    
+
+    def _configure_http_pooling(self):
+        """Mount a pooled transport on the SDK's underlying requests.Session"""
+        http_session = getattr(self.session, 'session', None)
+        if http_session is None:
+            http_session = requests.Session()
+            self.session.session = http_session
+
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=50,
+            max_retries=Retry(total=2, backoff_factor=0.2)
+        )
+        http_session.mount('http://', adapter)
+        http_session.mount('https://', adapter)
+
+    def close(self):
+        """Close the underlying HTTP session and release pooled connections"""
+        http_session = getattr(self.session, 'session', None)
+        if http_session is not None:
+            http_session.close()
+        self.session = None
+
     def get_session(self) -> Session:
         """Get the current session, creating it if necessary"""
         if not self.session:
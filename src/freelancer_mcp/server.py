@@ -2,10 +2,13 @@
 Main MCP Server implementation for Freelancer.com API
 """
 
+import asyncio
 import logging
+from itertools import islice
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 
+from cachetools import TTLCache
 from mcp.server.fastmcp import FastMCP
 from pydantic import ValidationError
 
@@ -16,11 +19,74 @@ from .models import (
 )
 from .exceptions import FreelancerMCPError, AuthenticationError
 
+# Bind SDK functions once at import time instead of re-importing on every
+# tool call; tools report the usual error response if the SDK is missing
+try:
+    from freelancersdk.resources.projects.projects import search_projects as _sdk_search_projects
+    from freelancersdk.resources.projects.projects import get_projects as _sdk_get_projects
+    from freelancersdk.resources.projects.helpers import create_search_projects_filter as _sdk_create_search_projects_filter
+    from freelancersdk.resources.projects.helpers import create_get_projects_object as _sdk_create_get_projects_object
+    from freelancersdk.resources.projects.helpers import create_get_projects_project_details_object as _sdk_create_project_details_object
+    from freelancersdk.resources.users.users import search_freelancers as _sdk_search_freelancers
+except ImportError:
+    _sdk_search_projects = None
+    _sdk_get_projects = None
+    _sdk_create_search_projects_filter = None
+    _sdk_create_get_projects_object = None
+    _sdk_create_project_details_object = None
+    _sdk_search_freelancers = None
+
+# Upper bound on project IDs fetched per API request; larger batches are
+# split into chunks and fetched concurrently, with at most this many
+# chunk requests in flight at a time
+_PROJECT_DETAILS_CHUNK_SIZE = 25
+_PROJECT_DETAILS_MAX_CONCURRENCY = 10
+
+# FastMCP owns the JSON-RPC wire format, so payload sizes are guarded by
+# capping free-text fields rather than switching serializers
+_MAX_DESCRIPTION_CHARS = 2000
+
+
+def _truncate_text(text: Optional[str]) -> Optional[str]:
+    """Cap long free-text fields so tool payloads stay bounded."""
+    if isinstance(text, str) and len(text) > _MAX_DESCRIPTION_CHARS:
+        return text[:_MAX_DESCRIPTION_CHARS] + '...'
+    return text
+
+
+def _invalid_request(detail: str) -> Dict[str, Any]:
+    """Error response for malformed tool input."""
+    return {
+        'success': False,
+        'error': 'Invalid request',
+        'message': detail
+    }
+
+
+# Prefer orjson (Rust) for resource serialization, falling back to stdlib json
+try:
+    import orjson
+
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    import json
+
+    def _json_dumps(obj: Any) -> str:
+        return json.dumps(obj, indent=2)
+
 # Configure logging
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
 logging.basicConfig(
     level=getattr(logging, settings.log_level.upper()),
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    format=LOG_FORMAT
 )
+# LOG_FORMAT uses none of the thread/process fields, so skip collecting
+# them when each record is created
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
 logger = logging.getLogger(__name__)
 
 class FreelancerMCPServer:
@@ -29,275 +95,563 @@ class FreelancerMCPServer:
     def __init__(self):
         self.mcp = FastMCP(settings.server_name)
         self.session_manager = FreelancerSession()
-        self._setup_tools()
-        self._setup_resources()
-        
-    def _setup_tools(self):
-        """Set up MCP tools."""
-        
-        @self.mcp.tool()
-        def search_projects(request: ProjectSearchRequest) -> Dict[str, Any]:
-            """
-            Search for projects on Freelancer.com
-            
-            Args:
-                request: ProjectSearchRequest with search parameters
-                
-            Returns:
-                Dict containing search results with project information
-            """
-            try:
-                session = self.session_manager.get_session()
-                
-                # Import SDK functions
-                from freelancersdk.resources.projects.projects import search_projects as sdk_search
-                from freelancersdk.resources.projects.helpers import create_search_projects_filter
-                from freelancersdk.resources.projects.exceptions import ProjectsNotFoundException
-                
-                search_filter = create_search_projects_filter(
-                    sort_field=request.sort_field,
-                    or_search_query=request.or_search_query,
-                )
-                
-                result = sdk_search(
-                    session,
-                    query=request.query,
-                    search_filter=search_filter
-                )
-                
-                # Process and return results
-                projects_data = []
-                if hasattr(result, 'projects') and result.projects:
-                    for project in result.projects[:request.limit]:
-                        project_info = {
-                            'id': getattr(project, 'id', None),
-                            'title': getattr(project, 'title', None),
-                            'description': getattr(project, 'description', None),
-                            'type': getattr(project, 'type', None),
-                            'budget': self._extract_budget_info(project),
-                            'owner': self._extract_owner_info(project),
-                            'time_updated': str(getattr(project, 'time_updated', None)),
-                            'submitdate': str(getattr(project, 'submitdate', None)),
-                            'bid_count': getattr(project, 'bid_count', None),
-                        }
-                        projects_data.append(project_info)
-                
-                return {
-                    'success': True,
-                    'query': request.query,
-                    'total_results': len(projects_data),
-                    'projects': projects_data
-                }
-                
-            except Exception as e:
-                logger.error(f"Error in search_projects: {e}")
-                return {
-                    'success': False,
-                    'error': 'Search failed',
-                    'message': 'Please check your OAuth token and try again'
-                }
-
-        @self.mcp.tool()
-        def search_freelancers(request: UserSearchRequest) -> Dict[str, Any]:
-            """
-            Search for freelancers on Freelancer.com
-            
-            Args:
-                request: UserSearchRequest with search parameters
-                
-            Returns:
-                Dict containing freelancer search results
-            """
-            try:
-                session = self.session_manager.get_session()
-                
-                # Import SDK functions
-                from freelancersdk.resources.users.users import search_freelancers as sdk_search
-                from freelancersdk.resources.users.exceptions import UsersNotFoundException
-                
-                # Build search parameters
-                search_params = {
-                    'query': request.query,
-                }
-                
-                if request.job_ids:
-                    search_params['job_ids'] = request.job_ids
-                if request.location_ids:
-                    search_params['location_ids'] = request.location_ids
-                    
-                result = sdk_search(session, **search_params)
-                
-                # Process results
-                freelancers_data = []
-                if hasattr(result, 'users') and result.users:
-                    for user in result.users[:request.limit]:
-                        freelancer_info = {
-                            'id': getattr(user, 'id', None),
-                            'username': getattr(user, 'username', None),
-                            'display_name': getattr(user, 'display_name', None),
-                            'avatar': getattr(user, 'avatar', None),
-                            'location': self._extract_location_info(user),
-                            'status': getattr(user, 'status', None),
-                            'reputation': self._extract_reputation_info(user),
-                            'hourly_rate': getattr(user, 'hourly_rate', None),
-                            'jobs': self._extract_user_jobs_info(user)
-                        }
-                        freelancers_data.append(freelancer_info)
-                
-                return {
-                    'success': True,
-                    'query': request.query,
-                    'total_results': len(freelancers_data),
-                    'freelancers': freelancers_data
-                }
-                
-            except Exception as e:
-                logger.error(f"Error in search_freelancers: {e}")
-                return {
-                    'success': False,
-                    'error': 'Search failed',
-                    'message': 'Please check your OAuth token and try again'
-                }
-
-        @self.mcp.tool()
-        def health_check() -> Dict[str, Any]:
-            """
-            Check the health status of the MCP server and Freelancer API connection
-            
-            Returns:
-                Dict containing health status information
-            """
-            try:
-                session = self.session_manager.get_session()
-                
-                health_status = {
-                    'server_status': 'healthy',
-                    'api_connection': 'active',
-                    'session_valid': True,
-                    'timestamp': datetime.now().isoformat(),
-                    'api_url': settings.api_url,
-                    'version': settings.server_version
-                }
-                
-                return health_status
-                
-            except Exception as e:
-                logger.error(f"Health check failed: {e}")
-                return {
-                    'server_status': 'degraded',
-                    'api_connection': 'failed',
-                    'session_valid': False,
-                    'error': str(e),
-                    'timestamp': datetime.now().isoformat()
-                }
-
-    def _setup_resources(self):
-        """Set up MCP resources."""
+        # Short-lived response cache keyed by normalized search parameters;
+        # shared between the single and batch search tools
+        self._search_cache = TTLCache(maxsize=256, ttl=60)
+        _register_tools(self)
+        _register_resources(self)
         
-        @self.mcp.resource("freelancer://config")
-        async def get_config_resource() -> str:
-            """Get current Freelancer API configuration"""
-            import json
-            return json.dumps({
-                'api_url': settings.api_url,
-                'has_token': bool(settings.oauth_token),
-                'session_active': bool(self.session_manager.session),
-                'server_name': settings.server_name,
-                'version': settings.server_version
-            }, indent=2)
-
-        @self.mcp.resource("freelancer://help")
-        async def get_help_resource() -> str:
-            """Get help information about available tools and resources"""
-            import json
-            help_info = {
-                'tools': {
-                    'search_projects': 'Search for projects by query with filtering options',
-                    'search_freelancers': 'Search for freelancers with various filters',
-                    'health_check': 'Check server and API connectivity status'
-                },
-                'resources': {
-                    'freelancer://config': 'Current API configuration status',
-                    'freelancer://help': 'This help information',
-                    'freelancer://examples': 'Usage examples for all tools'
-                },
-                'authentication': {
-                    'required_env_vars': {
-                        'FLN_OAUTH_TOKEN': 'OAuth2 token for Freelancer API (required)',
-                        'FLN_URL': 'API base URL (optional, defaults to https://www.freelancer.com)'
-                    },
-                    'how_to_get_token': 'Visit https://developers.freelancer.com to create an app and get OAuth token'
-                }
-            }
-            return json.dumps(help_info, indent=2)
-
-    # Helper methods for data extraction
+    # Helper methods for data extraction; nested SDK objects are resolved
+    # once into locals instead of repeated hasattr/attribute chains
     def _extract_budget_info(self, project) -> Dict[str, Any]:
         """Extract budget information from project."""
-        if hasattr(project, 'budget') and project.budget:
+        budget = getattr(project, 'budget', None)
+        if budget:
             return {
-                'minimum': getattr(project.budget, 'minimum', None),
-                'maximum': getattr(project.budget, 'maximum', None),
-                'currency': getattr(project.budget.currency, 'code', None) if hasattr(project.budget, 'currency') else None
+                'minimum': getattr(budget, 'minimum', None),
+                'maximum': getattr(budget, 'maximum', None),
+                'currency': getattr(getattr(budget, 'currency', None), 'code', None)
             }
         return {'minimum': None, 'maximum': None, 'currency': None}
 
     def _extract_owner_info(self, project) -> Dict[str, Any]:
         """Extract owner information from project."""
-        if hasattr(project, 'owner') and project.owner:
+        owner = getattr(project, 'owner', None)
+        if owner:
             return {
-                'id': getattr(project.owner, 'id', None),
-                'username': getattr(project.owner, 'username', None),
-                'display_name': getattr(project.owner, 'display_name', None)
+                'id': getattr(owner, 'id', None),
+                'username': getattr(owner, 'username', None),
+                'display_name': getattr(owner, 'display_name', None)
             }
         return {'id': None, 'username': None, 'display_name': None}
 
     def _extract_location_info(self, user) -> Dict[str, Any]:
         """Extract location information from user."""
-        if hasattr(user, 'location') and user.location:
+        location = getattr(user, 'location', None)
+        if location:
             return {
-                'country': getattr(user.location.country, 'name', None) if hasattr(user.location, 'country') else None,
-                'city': getattr(user.location.city, 'name', None) if hasattr(user.location, 'city') else None
+                'country': getattr(getattr(location, 'country', None), 'name', None),
+                'city': getattr(getattr(location, 'city', None), 'name', None)
             }
         return {'country': None, 'city': None}
 
     def _extract_reputation_info(self, user) -> Dict[str, Any]:
         """Extract reputation information from user."""
-        if hasattr(user, 'reputation') and user.reputation:
+        reputation = getattr(user, 'reputation', None)
+        if reputation:
             return {
-                'entire_site': getattr(user.reputation.entire_site, 'rating', None) if hasattr(user.reputation, 'entire_site') else None,
-                'category_ratings': getattr(user.reputation, 'category_ratings', [])
+                'entire_site': getattr(getattr(reputation, 'entire_site', None), 'rating', None),
+                'category_ratings': getattr(reputation, 'category_ratings', [])
             }
         return {'entire_site': None, 'category_ratings': []}
 
     def _extract_user_jobs_info(self, user) -> List[Dict[str, Any]]:
         """Extract jobs/skills information from user."""
-        if hasattr(user, 'jobs') and user.jobs:
+        jobs = getattr(user, 'jobs', None)
+        if jobs:
             return [
                 {
                     'id': getattr(job, 'id', None),
                     'name': getattr(job, 'name', None)
-                } for job in user.jobs
+                } for job in jobs
             ]
         return []
 
     def run(self):
         """Start the MCP server."""
         logger.info("Starting Freelancer MCP Server...")
-        logger.info(f"Server: {settings.server_name} v{settings.server_version}")
-        logger.info(f"API URL: {settings.api_url}")
+        logger.info("Server: %s v%s", settings.server_name, settings.server_version)
+        logger.info("API URL: %s", settings.api_url)
         
         if not settings.oauth_token:
             logger.error("Missing required environment variable: FLN_OAUTH_TOKEN")
             logger.error("Please set your Freelancer OAuth token in the environment")
             return
         
-        logger.info("Available tools: search_projects, search_freelancers, health_check")
+        logger.info("Available tools: search_projects, batch_search_projects, "
+                    "get_project_details, search_freelancers, health_check")
         logger.info("Available resources: freelancer://config, freelancer://help")
         
         self.mcp.run()
 
 
+def _register_tools(server: "FreelancerMCPServer") -> None:
+    """Register MCP tools on the server's FastMCP instance."""
+    
+    @server.mcp.tool()
+    async def search_projects(request: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Search for projects on Freelancer.com
+
+        Args:
+            request: Search parameters matching the ProjectSearchRequest schema
+
+        Returns:
+            Dict containing search results with project information
+        """
+        # Minimal inline validation; the full schema lives in
+        # ProjectSearchRequest for documentation purposes
+        try:
+            query = str(request['query'])
+            sort_field = str(request.get('sort_field', 'time_updated'))
+            or_search_query = bool(request.get('or_search_query', True))
+            limit = max(1, min(int(request.get('limit', 10)), 100))
+        except KeyError as e:
+            return _invalid_request(f"missing required field: {e.args[0]}")
+        except (TypeError, ValueError):
+            return _invalid_request("'limit' must be an integer")
+
+        try:
+            cache_key = ('projects', query, sort_field, or_search_query, limit)
+            projects_data = server._search_cache.get(cache_key)
+            if projects_data is None:
+                session = server.session_manager.get_session()
+
+                search_filter = _sdk_create_search_projects_filter(
+                    sort_field=sort_field,
+                    or_search_query=or_search_query,
+                )
+
+                result = await asyncio.to_thread(
+                    _sdk_search_projects,
+                    session,
+                    query=query,
+                    search_filter=search_filter,
+                    limit=limit
+                )
+
+                # Process results; locals alias the helpers so the
+                # comprehension avoids repeated lookups per project
+                projects_data = []
+                projects = getattr(result, 'projects', None)
+                if projects:
+                    _get = getattr
+                    _budget = server._extract_budget_info
+                    _owner = server._extract_owner_info
+                    projects_data = [
+                        {
+                            'id': _get(project, 'id', None),
+                            'title': _get(project, 'title', None),
+                            'description': _truncate_text(_get(project, 'description', None)),
+                            'type': _get(project, 'type', None),
+                            'budget': _budget(project),
+                            'owner': _owner(project),
+                            'time_updated': str(_get(project, 'time_updated', None)),
+                            'submitdate': str(_get(project, 'submitdate', None)),
+                            'bid_count': _get(project, 'bid_count', None),
+                        }
+                        for project in islice(projects, limit)
+                    ]
+
+                server._search_cache[cache_key] = projects_data
+
+            return {
+                'success': True,
+                'query': query,
+                'total_results': len(projects_data),
+                'projects': projects_data
+            }
+            
+        except Exception as e:
+            logger.error("Error in search_projects: %s", e, exc_info=True)
+            return {
+                'success': False,
+                'error': 'Search failed',
+                'message': 'Please check your OAuth token and try again'
+            }
+
+    @server.mcp.tool()
+    async def batch_search_projects(request: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Search for projects with several queries in a single tool call
+
+        Duplicate queries are collapsed DataLoader-style so each distinct
+        query hits the Freelancer API exactly once, and the uncached
+        queries are dispatched concurrently so a batch costs roughly one
+        round trip instead of one per query.
+
+        Args:
+            request: Dict with 'queries' (list of at most 100 search
+                strings; larger batches are rejected) plus the optional
+                sort_field/or_search_query/limit parameters shared by
+                all queries
+
+        Returns:
+            Dict mapping each query to a per-query entry carrying its own
+            success flag, so one failed query does not fail the batch
+        """
+        try:
+            raw_queries = request['queries']
+            if not isinstance(raw_queries, (list, tuple)):
+                return _invalid_request("'queries' must be a list of search strings")
+            if len(raw_queries) > 100:
+                return _invalid_request(
+                    f"'queries' accepts at most 100 entries, got {len(raw_queries)}"
+                )
+            queries = [str(q) for q in raw_queries]
+            sort_field = str(request.get('sort_field', 'time_updated'))
+            or_search_query = bool(request.get('or_search_query', True))
+            limit = max(1, min(int(request.get('limit', 10)), 100))
+        except KeyError as e:
+            return _invalid_request(f"missing required field: {e.args[0]}")
+        except (TypeError, ValueError):
+            return _invalid_request("'limit' must be an integer")
+
+        try:
+            session = server.session_manager.get_session()
+
+            search_filter = _sdk_create_search_projects_filter(
+                sort_field=sort_field,
+                or_search_query=or_search_query,
+            )
+
+            # Serve what we can from the cache, then fan the remaining
+            # distinct queries out concurrently
+            results_by_query = {}
+            pending = []
+            for query in dict.fromkeys(queries):
+                cache_key = ('projects', query, sort_field, or_search_query, limit)
+                cached = server._search_cache.get(cache_key)
+                if cached is not None:
+                    results_by_query[query] = {'success': True, 'projects': cached}
+                else:
+                    pending.append((query, cache_key))
+
+            fetched = await asyncio.gather(
+                *(
+                    asyncio.to_thread(
+                        _sdk_search_projects,
+                        session,
+                        query=query,
+                        search_filter=search_filter,
+                        limit=limit
+                    )
+                    for query, _ in pending
+                ),
+                return_exceptions=True
+            )
+
+            # Aliases hoisted out of the per-query loop
+            _get = getattr
+            _budget = server._extract_budget_info
+            _owner = server._extract_owner_info
+
+            for (query, cache_key), result in zip(pending, fetched):
+                if isinstance(result, BaseException):
+                    logger.error("Error in batch_search_projects for %r: %s",
+                                 query, result, exc_info=result)
+                    results_by_query[query] = {'success': False, 'error': str(result)}
+                    continue
+
+                projects_data = []
+                projects = getattr(result, 'projects', None)
+                if projects:
+                    projects_data = [
+                        {
+                            'id': _get(project, 'id', None),
+                            'title': _get(project, 'title', None),
+                            'description': _truncate_text(_get(project, 'description', None)),
+                            'type': _get(project, 'type', None),
+                            'budget': _budget(project),
+                            'owner': _owner(project),
+                            'time_updated': str(_get(project, 'time_updated', None)),
+                            'submitdate': str(_get(project, 'submitdate', None)),
+                            'bid_count': _get(project, 'bid_count', None),
+                        }
+                        for project in islice(projects, limit)
+                    ]
+
+                server._search_cache[cache_key] = projects_data
+                results_by_query[query] = {'success': True, 'projects': projects_data}
+
+            return {
+                'success': True,
+                'total_queries': len(results_by_query),
+                'results': results_by_query
+            }
+
+        except Exception as e:
+            logger.error("Error in batch_search_projects: %s", e, exc_info=True)
+            return {
+                'success': False,
+                'error': 'Batch search failed',
+                'message': 'Please check your OAuth token and try again'
+            }
+
+    @server.mcp.tool()
+    async def get_project_details(request: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Fetch details for a batch of projects by ID
+
+        Large ID lists are split into chunks and fetched concurrently with
+        asyncio.gather, so a batch costs roughly one API round trip. A
+        failing chunk is reported per ID in the 'failed' list instead of
+        failing the whole batch.
+
+        Args:
+            request: Parameters matching the ProjectDetailsRequest schema
+
+        Returns:
+            Dict containing the requested project details plus per-ID
+            entries for any IDs that could not be fetched
+        """
+        try:
+            project_ids = [int(pid) for pid in request['project_ids']]
+            full_description = bool(request.get('full_description', True))
+            include_jobs = bool(request.get('include_jobs', True))
+            include_qualifications = bool(request.get('include_qualifications', False))
+        except KeyError as e:
+            return _invalid_request(f"missing required field: {e.args[0]}")
+        except (TypeError, ValueError):
+            return _invalid_request("'project_ids' must be a list of integers")
+
+        try:
+            session = server.session_manager.get_session()
+
+            project_details = _sdk_create_project_details_object(
+                full_description=full_description,
+                jobs=include_jobs,
+                qualifications=include_qualifications,
+            )
+
+            def fetch(ids):
+                query = _sdk_create_get_projects_object(
+                    project_ids=ids,
+                    project_details=project_details,
+                )
+                return _sdk_get_projects(session, query)
+
+            # Bound the fan-out so an arbitrarily long ID list cannot
+            # flood the API with unbounded concurrent requests
+            semaphore = asyncio.Semaphore(_PROJECT_DETAILS_MAX_CONCURRENCY)
+
+            async def fetch_chunk(ids):
+                async with semaphore:
+                    return await asyncio.to_thread(fetch, ids)
+
+            chunks = [
+                project_ids[i:i + _PROJECT_DETAILS_CHUNK_SIZE]
+                for i in range(0, len(project_ids), _PROJECT_DETAILS_CHUNK_SIZE)
+            ]
+            results = await asyncio.gather(
+                *(fetch_chunk(ids) for ids in chunks),
+                return_exceptions=True
+            )
+
+            _get = getattr
+            _budget = server._extract_budget_info
+            _owner = server._extract_owner_info
+            # Callers who asked for the full description get it untruncated;
+            # the payload cap only applies to preview-mode fetches
+            _clip = (lambda text: text) if full_description else _truncate_text
+
+            projects_data = []
+            failed = []
+            for ids, result in zip(chunks, results):
+                if isinstance(result, BaseException):
+                    logger.error("Error fetching project details for %s: %s",
+                                 ids, result, exc_info=result)
+                    failed.extend({'id': pid, 'error': str(result)} for pid in ids)
+                    continue
+
+                projects = getattr(result, 'projects', None)
+                if projects:
+                    projects_data.extend(
+                        {
+                            'id': _get(project, 'id', None),
+                            'title': _get(project, 'title', None),
+                            'description': _clip(_get(project, 'description', None)),
+                            'type': _get(project, 'type', None),
+                            'budget': _budget(project),
+                            'owner': _owner(project),
+                            'time_updated': str(_get(project, 'time_updated', None)),
+                            'submitdate': str(_get(project, 'submitdate', None)),
+                            'bid_count': _get(project, 'bid_count', None),
+                        }
+                        for project in projects
+                    )
+
+            return {
+                'success': True,
+                'total_results': len(projects_data),
+                'projects': projects_data,
+                'failed': failed
+            }
+
+        except Exception as e:
+            logger.error("Error in get_project_details: %s", e, exc_info=True)
+            return {
+                'success': False,
+                'error': 'Project details fetch failed',
+                'message': 'Please check your OAuth token and try again'
+            }
+
+    @server.mcp.tool()
+    async def search_freelancers(request: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Search for freelancers on Freelancer.com
+
+        Args:
+            request: Search parameters matching the UserSearchRequest schema
+
+        Returns:
+            Dict containing freelancer search results
+        """
+        # Minimal inline validation; the full schema lives in
+        # UserSearchRequest for documentation purposes
+        try:
+            query = str(request['query'])
+            job_ids = request.get('job_ids')
+            location_ids = request.get('location_ids')
+            limit = max(1, min(int(request.get('limit', 10)), 100))
+        except KeyError as e:
+            return _invalid_request(f"missing required field: {e.args[0]}")
+        except (TypeError, ValueError):
+            return _invalid_request("'limit' must be an integer")
+
+        try:
+            cache_key = (
+                'users', query,
+                tuple(job_ids) if job_ids else None,
+                tuple(location_ids) if location_ids else None,
+                limit
+            )
+            freelancers_data = server._search_cache.get(cache_key)
+            if freelancers_data is None:
+                session = server.session_manager.get_session()
+
+                # Build search parameters
+                search_params = {
+                    'query': query,
+                    'limit': limit,
+                }
+
+                if job_ids:
+                    search_params['job_ids'] = job_ids
+                if location_ids:
+                    search_params['location_ids'] = location_ids
+
+                result = await asyncio.to_thread(
+                    _sdk_search_freelancers, session, **search_params
+                )
+
+                # Process results; same local-alias comprehension as projects
+                freelancers_data = []
+                users = getattr(result, 'users', None)
+                if users:
+                    _get = getattr
+                    _location = server._extract_location_info
+                    _reputation = server._extract_reputation_info
+                    _jobs = server._extract_user_jobs_info
+                    freelancers_data = [
+                        {
+                            'id': _get(user, 'id', None),
+                            'username': _get(user, 'username', None),
+                            'display_name': _get(user, 'display_name', None),
+                            'avatar': _get(user, 'avatar', None),
+                            'location': _location(user),
+                            'status': _get(user, 'status', None),
+                            'reputation': _reputation(user),
+                            'hourly_rate': _get(user, 'hourly_rate', None),
+                            'jobs': _jobs(user)
+                        }
+                        for user in islice(users, limit)
+                    ]
+
+                server._search_cache[cache_key] = freelancers_data
+            
+            return {
+                'success': True,
+                'query': query,
+                'total_results': len(freelancers_data),
+                'freelancers': freelancers_data
+            }
+            
+        except Exception as e:
+            logger.error("Error in search_freelancers: %s", e, exc_info=True)
+            return {
+                'success': False,
+                'error': 'Search failed',
+                'message': 'Please check your OAuth token and try again'
+            }
+
+    # Static portion of the healthy payload; only the timestamp varies
+    healthy_status = {
+        'server_status': 'healthy',
+        'api_connection': 'active',
+        'session_valid': True,
+        'api_url': settings.api_url,
+        'version': settings.server_version
+    }
+
+    @server.mcp.tool()
+    def health_check() -> Dict[str, Any]:
+        """
+        Check the health status of the MCP server and Freelancer API connection
+
+        Returns:
+            Dict containing health status information
+        """
+        try:
+            session = server.session_manager.get_session()
+
+            return {**healthy_status, 'timestamp': datetime.now().isoformat()}
+
+        except Exception as e:
+            logger.error("Health check failed: %s", e, exc_info=True)
+            return {
+                'server_status': 'degraded',
+                'api_connection': 'failed',
+                'session_valid': False,
+                'error': str(e),
+                'timestamp': datetime.now().isoformat()
+            }
+
+
+def _register_resources(server: "FreelancerMCPServer") -> None:
+    """Register MCP resources on the server's FastMCP instance."""
+    
+    @server.mcp.resource("freelancer://config")
+    async def get_config_resource() -> str:
+        """Get current Freelancer API configuration"""
+        return _json_dumps({
+            'api_url': settings.api_url,
+            'has_token': bool(settings.oauth_token),
+            'session_active': bool(server.session_manager.session),
+            'server_name': settings.server_name,
+            'version': settings.server_version
+        })
+
+    # The help payload is fully static, so it is serialized once at
+    # registration time instead of on every read
+    help_json = _json_dumps({
+        'tools': {
+            'search_projects': 'Search for projects by query with filtering options',
+            'batch_search_projects': 'Search for projects with several queries in one call',
+            'get_project_details': 'Fetch details for a batch of projects by ID',
+            'search_freelancers': 'Search for freelancers with various filters',
+            'health_check': 'Check server and API connectivity status'
+        },
+        'resources': {
+            'freelancer://config': 'Current API configuration status',
+            'freelancer://help': 'This help information',
+            'freelancer://examples': 'Usage examples for all tools'
+        },
+        'authentication': {
+            'required_env_vars': {
+                'FLN_OAUTH_TOKEN': 'OAuth2 token for Freelancer API (required)',
+                'FLN_URL': 'API base URL (optional, defaults to https://www.freelancer.com)'
+            },
+            'how_to_get_token': 'Visit https://developers.freelancer.com to create an app and get OAuth token'
+        }
+    })
+
+    @server.mcp.resource("freelancer://help")
+    async def get_help_resource() -> str:
+        """Get help information about available tools and resources"""
+        return help_json
+
+
 def main():
     """Main entry point for the MCP server"""
     try:
@@ -306,7 +660,7 @@ def main():
     except KeyboardInterrupt:
         logger.info("Server stopped by user")
     except Exception as e:
-        logger.error(f"Server failed to start: {e}")
+        logger.error("Server failed to start: %s", e, exc_info=True)
         raise
 
 